@@ -18,6 +18,16 @@ class TestRoutes(unittest.TestCase):
 
         self.assertEqual(self.client.get("/").status_code, 200)
 
+    def test_homepage_etag(self):
+        """
+        When given the index URL with the ETag of a previous
+        response, we should return a 304 status code
+        """
+
+        etag = self.client.get("/").headers["ETag"]
+        response = self.client.get("/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
     def test_not_found(self):
         """
         When given a non-existent URL,
@@ -36,6 +46,21 @@ class TestRoutes(unittest.TestCase):
             response.location, "http://localhost/login?next=/demo"
         )
 
+    def test_logout(self):
+        """
+        Logout should empty the session and redirect,
+        whether or not a session cookie was sent.
+        """
+        response = self.client.get("/logout")
+        self.assertEqual(response.status_code, 302)
+
+        with self.client.session_transaction() as s:
+            s["openid"] = "openid"
+        response = self.client.get("/logout")
+        self.assertEqual(response.status_code, 302)
+        with self.client.session_transaction() as s:
+            self.assertNotIn("openid", s)
+
     def test_demo_login(self):
         """
         Demo page should be accessible if openid in session not empty.
@@ -1,7 +1,7 @@
 import functools
 import os
 
-import flask
+from flask import make_response, redirect, render_template, request, session
 
 from canonicalwebteam.flask_base.app import FlaskBase
 from flask_openid import OpenID
@@ -30,26 +30,39 @@ def login_required(func):
 
     @functools.wraps(func)
     def is_user_logged_in(*args, **kwargs):
-        if "openid" not in flask.session:
-            return flask.redirect("/login?next=" + flask.request.path)
+        if "openid" not in session:
+            return redirect("/login?next=" + request.path)
 
         return func(*args, **kwargs)
 
     return is_user_logged_in
 
 
+@functools.lru_cache(maxsize=2)
+def render_index(logged_in):
+    """
+    Render the index template once per login state and memoize the
+    result. The layout only reads the session to decide between the
+    login and logout links, so two cached variants cover every request.
+    """
+    return render_template("index.html")
+
+
 @app.route("/")
 def index():
-    return flask.render_template("index.html")
+    response = make_response(render_index("openid" in session))
+    response.add_etag()
+    response.vary.add("Cookie")
+    return response.make_conditional(request)
 
 
 @open_id.after_login
 def after_login(resp):
-    flask.session["openid"] = {
+    session["openid"] = {
         "identity_url": resp.identity_url,
         "email": resp.email,
     }
-    return flask.redirect(open_id.get_next_url())
+    return redirect(open_id.get_next_url())
 
 
 @app.route("/logout")
@@ -57,16 +70,22 @@ def logout():
     """
     Empty the session, used to logout.
     """
-    flask.session.pop("openid", None)
+    if app.session_cookie_name not in request.cookies:
+        # Anonymous traffic (crawlers, link prefetchers) has no session
+        # cookie; popping from the empty session would mark it modified
+        # and emit a needless cookie-deletion Set-Cookie header.
+        return redirect(open_id.get_next_url())
+
+    session.pop("openid", None)
 
-    return flask.redirect(open_id.get_next_url())
+    return redirect(open_id.get_next_url())
 
 
 @app.route("/login", methods=["GET", "POST"])
 @open_id.loginhandler
 def login_handler():
-    if "openid" in flask.session:
-        return flask.redirect(open_id.get_next_url())
+    if "openid" in session:
+        return redirect(open_id.get_next_url())
 
     return open_id.try_login(LOGIN_URL, ask_for=["email"])
 
@@ -74,4 +93,4 @@ def login_handler():
 @app.route("/demo")
 @login_required
 def demo():
-    return flask.render_template("demo.html")
+    return render_template("demo.html")